@@ -31,6 +31,10 @@ fi
 
 "$VENV_DIR/bin/python" -m pip install "${PIP_ARGS[@]}" -r "$ROOT_DIR/requirements.txt"
 
+if [ "${PARAKEET_WITH_NEMO:-0}" = "1" ]; then
+  "$VENV_DIR/bin/python" -m pip install "${PIP_ARGS[@]}" -r "$ROOT_DIR/requirements-nemo.txt"
+fi
+
 cargo build --release --bin parakeet
 install -m 0755 "$ROOT_DIR/target/release/parakeet" "$ROOT_DIR/parakeet"
 
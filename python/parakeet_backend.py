@@ -1,22 +1,35 @@
 #!/usr/bin/env python3
+import abc
 import argparse
+import contextlib
 import errno
+import functools
 import inspect
 import json
 import os
+import queue
 import re
+import selectors
 import socket
+import stat
+import struct
 import subprocess
 import sys
-import tempfile
+import threading
 import time
-import wave
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator, Protocol
 
-import torch
+import msgspec
+import numpy as np
 from rapidfuzz import fuzz, process
 
+try:
+    import orjson
+except ImportError:  # optional: faster JSON encoding straight to bytes
+    orjson = None
+
 
 def detect_parakeet_home() -> Path:
     env_home = os.environ.get("PARAKEET_HOME")
@@ -31,14 +44,39 @@ LHOTSE_HOME = PARAKEET_HOME_DEFAULT / ".cache/home"
 LHOTSE_HOME.mkdir(parents=True, exist_ok=True)
 os.environ["HOME"] = str(LHOTSE_HOME)
 
-import nemo.collections.asr as nemo_asr
+DEFAULT_BACKEND = "nano"
+SAMPLE_RATE = 16000
+# Daemon wire format: version byte + big-endian u32 length + JSON body.
+# Requests starting with any other byte use legacy newline-terminated JSON.
+FRAME_V1 = 0x01
+FRAME_HEADER = struct.Struct(">BI")
+MAX_FRAME_BYTES = 64 * 1024 * 1024
+# Above this many single-word terms, fuzzy matching prunes candidates by prefix/length.
+FUZZY_PREFIX_INDEX_MIN_TERMS = 1000
+_WORD_RE = re.compile(r"\b[\w'-]+\b")
+# torch dtype attribute names; torch itself is imported lazily so CLI error paths stay fast.
+PRECISION_DTYPES = {
+    "fp32": "float32",
+    "bf16": "bfloat16",
+    "fp16": "float16",
+}
+
+
+_sampler_patched = False
 
 
 def patch_sampler_compat() -> None:
     """
-    Lhotse in current NeMo path passes `data_source` into torch Sampler.__init__.
+    Lhotse in the NeMo backend path passes `data_source` into torch Sampler.__init__.
     Newer torch variants may reject that argument, so we ignore it safely.
+    Runs once per process; the patched __init__ no longer lists `data_source`,
+    so re-checking the signature would wrap it again on every model load.
     """
+    global _sampler_patched
+    if _sampler_patched:
+        return
+    _sampler_patched = True
+
     from torch.utils.data import Sampler
 
     signature = inspect.signature(Sampler.__init__)
@@ -59,8 +97,18 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--json", help="JSON request from Rust CLI")
     parser.add_argument("--serve", action="store_true", help="Run persistent backend daemon")
     parser.add_argument("--socket-path", default=str(PARAKEET_HOME_DEFAULT / "tmp/parakeet.sock"))
+    parser.add_argument("--service-backend", default=DEFAULT_BACKEND, choices=sorted(BACKENDS))
     parser.add_argument("--service-model", default="nvidia/parakeet-tdt-0.6b-v3")
     parser.add_argument("--service-device", default="auto")
+    parser.add_argument("--service-precision", default="auto")
+    parser.add_argument(
+        "--service-compile",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="torch.compile the encoder on CUDA before serving",
+    )
+    parser.add_argument("--service-max-batch", type=int, default=8)
+    parser.add_argument("--service-batch-wait-ms", type=float, default=10.0)
     parser.add_argument("--verbose", action="store_true")
     args = parser.parse_args()
     if not args.serve and not args.json:
@@ -68,19 +116,38 @@ def parse_args() -> argparse.Namespace:
     return args
 
 
-def read_request(raw_json: str) -> dict[str, Any]:
+@dataclass
+class BackendRequest:
+    input: str
+    model: str
+    device: str
+    format: str
+    timestamps: bool
+    fuzzy_vocab: bool
+    verbose: bool
+    output: str | None = None
+    vocab: str | None = None
+    backend: str | None = None
+    precision: str | None = None
+
+
+def read_request(raw_json: str | bytes) -> BackendRequest:
+    """Decode and type-check one request in a single msgspec pass."""
     try:
-        req = json.loads(raw_json)
-    except json.JSONDecodeError as exc:
-        raise RuntimeError(f"invalid JSON request: {exc}") from exc
-    required = ["input", "model", "device", "format", "timestamps", "fuzzy_vocab", "verbose"]
-    for key in required:
-        if key not in req:
-            raise RuntimeError(f"missing request key: {key}")
-    return req
+        return msgspec.json.decode(raw_json, type=BackendRequest)
+    except msgspec.ValidationError as exc:
+        raise RuntimeError(f"invalid request: {exc}") from None
+    except msgspec.DecodeError as exc:
+        raise RuntimeError(f"invalid JSON request: {exc}") from None
+
+
+_dirs_ready: set[Path] = set()
 
 
 def ensure_runtime_dirs(parakeet_home: Path) -> None:
+    """Create runtime dirs once per process; later calls (every daemon request) are a set lookup."""
+    if parakeet_home in _dirs_ready:
+        return
     for rel in [
         ".cache/home",
         ".cache/hf",
@@ -91,46 +158,96 @@ def ensure_runtime_dirs(parakeet_home: Path) -> None:
         "tmp",
     ]:
         (parakeet_home / rel).mkdir(parents=True, exist_ok=True)
+    _dirs_ready.add(parakeet_home)
 
 
-def normalize_audio(in_path: Path, temp_dir: Path, verbose: bool) -> Path:
-    if in_path.suffix.lower() in {".wav", ".flac", ".mp3", ".m4a", ".ogg"}:
-        return in_path
-
-    out_path = temp_dir / f"{in_path.stem}.wav"
+def decode_with_ffmpeg(in_path: Path, verbose: bool) -> np.ndarray:
+    """Decode via an ffmpeg pipe (raw f32le on stdout), for containers libsndfile cannot open."""
     cmd = [
         "ffmpeg",
-        "-y",
+        "-nostdin",
         "-i",
         str(in_path),
         "-ac",
         "1",
         "-ar",
-        "16000",
-        str(out_path),
+        str(SAMPLE_RATE),
+        "-f",
+        "f32le",
+        "-",
     ]
     if verbose:
         print(f"[parakeet] converting input via ffmpeg: {' '.join(cmd)}", file=sys.stderr)
-    proc = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+    proc = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
     if proc.returncode != 0:
         raise RuntimeError(
             "ffmpeg conversion failed. install ffmpeg or pass a supported audio file.\n"
-            f"{proc.stderr.strip()}"
+            f"{proc.stderr.decode('utf-8', errors='replace').strip()}"
         )
-    return out_path
+    return np.frombuffer(proc.stdout, dtype=np.float32)
+
+
+def load_and_normalize(in_path: Path, verbose: bool) -> np.ndarray:
+    """Decode once into mono float32 @ SAMPLE_RATE; the array goes straight to the model."""
+    import soundfile as sf
+
+    try:
+        data, rate = sf.read(str(in_path), dtype="float32", always_2d=False)
+    except Exception as exc:
+        if verbose:
+            print(f"[parakeet] soundfile cannot read input, using ffmpeg: {exc}", file=sys.stderr)
+        return decode_with_ffmpeg(in_path, verbose)
+
+    if data.ndim > 1:
+        data = data.mean(axis=1)
+    if rate != SAMPLE_RATE:
+        import soxr
+
+        if verbose:
+            print(f"[parakeet] resampling input in-process: {rate}Hz -> {SAMPLE_RATE}Hz", file=sys.stderr)
+        data = soxr.resample(data, rate, SAMPLE_RATE)
+    return np.ascontiguousarray(data, dtype=np.float32)
+
+
+@functools.lru_cache(maxsize=None)
+def cuda_available() -> bool:
+    import torch
+
+    return torch.cuda.is_available()
+
+
+def precision_dtype(precision: str) -> Any:
+    import torch
+
+    return getattr(torch, PRECISION_DTYPES[precision])
 
 
 def pick_device(requested: str) -> str:
     req = requested.lower()
     if req == "auto":
-        return "cuda" if torch.cuda.is_available() else "cpu"
+        return "cuda" if cuda_available() else "cpu"
     if req in {"cpu", "cuda"}:
-        if req == "cuda" and not torch.cuda.is_available():
+        if req == "cuda" and not cuda_available():
             raise RuntimeError("device=cuda requested but CUDA is not available")
         return req
     raise RuntimeError("invalid --device. allowed: auto|cpu|cuda")
 
 
+def pick_precision(requested: str, device: str) -> str:
+    req = requested.lower()
+    if req == "auto":
+        if device != "cuda":
+            return "fp32"
+        import torch
+
+        return "bf16" if torch.cuda.is_bf16_supported() else "fp16"
+    if req not in PRECISION_DTYPES:
+        raise RuntimeError(f"invalid --precision. allowed: auto|{'|'.join(PRECISION_DTYPES)}")
+    if req != "fp32" and device != "cuda":
+        raise RuntimeError(f"precision={req} requires device=cuda")
+    return req
+
+
 def load_vocab(path: Path | None) -> list[str]:
     if path is None:
         return []
@@ -144,33 +261,113 @@ def load_vocab(path: Path | None) -> list[str]:
     return terms
 
 
-def apply_vocab_rules(text: str, vocab_terms: list[str], fuzzy_enabled: bool) -> str:
-    if not vocab_terms:
-        return text
+@dataclass(frozen=True)
+class VocabRules:
+    terms: tuple[str, ...]
+    terms_by_lower: dict[str, str]
+    exact_pattern: re.Pattern[str] | None
+    fuzzy_words: list[str]
+    fuzzy_by_prefix: dict[str, list[int]] | None
+
 
-    updated = text
+def build_vocab_rules(vocab_terms: list[str]) -> VocabRules:
     terms_by_lower = {t.lower(): t for t in vocab_terms}
+    exact_pattern = None
+    if terms_by_lower:
+        # Longest first so multi-word terms win over their prefixes.
+        alternation = "|".join(re.escape(t) for t in sorted(terms_by_lower, key=len, reverse=True))
+        exact_pattern = re.compile(rf"(?i)\b(?:{alternation})\b")
+    fuzzy_words = [t for t in vocab_terms if " " not in t]
+    fuzzy_by_prefix = None
+    if len(fuzzy_words) > FUZZY_PREFIX_INDEX_MIN_TERMS:
+        fuzzy_by_prefix = {}
+        for i, word in enumerate(fuzzy_words):
+            fuzzy_by_prefix.setdefault(word[:2].lower(), []).append(i)
+    return VocabRules(
+        terms=tuple(vocab_terms),
+        terms_by_lower=terms_by_lower,
+        exact_pattern=exact_pattern,
+        fuzzy_words=fuzzy_words,
+        fuzzy_by_prefix=fuzzy_by_prefix,
+    )
+
+
+EMPTY_VOCAB = build_vocab_rules([])
+
+
+@functools.lru_cache(maxsize=8)
+def _load_vocab_cached(path: str, mtime_ns: int) -> VocabRules:
+    return build_vocab_rules(load_vocab(Path(path)))
+
+
+def load_vocab_rules(path: Path | None) -> VocabRules:
+    """Vocab file -> compiled rules, cached by (path, mtime) across daemon requests."""
+    if path is None:
+        return EMPTY_VOCAB
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except FileNotFoundError:
+        raise RuntimeError(f"vocab file not found: {path}") from None
+    return _load_vocab_cached(str(path), mtime_ns)
+
 
-    for lower_term, canonical_term in terms_by_lower.items():
-        pattern = re.compile(rf"(?i)\b{re.escape(lower_term)}\b")
-        updated = pattern.sub(canonical_term, updated)
+def best_fuzzy_matches(words: list[str], vocab: VocabRules) -> list[int | None]:
+    """
+    Index into `vocab.fuzzy_words` of each word's best match scoring >= 90, else None.
+    Strings are compared as-is (no processor), like the original extractOne calls.
+    """
+    if vocab.fuzzy_by_prefix is None:
+        # One threaded C++ pass over unique words x vocab.
+        scores = process.cdist(words, vocab.fuzzy_words, scorer=fuzz.WRatio, score_cutoff=90, workers=-1)
+        best_idx = scores.argmax(axis=1)
+        best_score = scores.max(axis=1)
+        return [int(idx) if score >= 90 else None for idx, score in zip(best_idx, best_score)]
+
+    # Large vocab: only score terms sharing the first two characters and within +-2 length.
+    matches: list[int | None] = []
+    for word in words:
+        indices = [
+            i
+            for i in vocab.fuzzy_by_prefix.get(word[:2].lower(), ())
+            if abs(len(vocab.fuzzy_words[i]) - len(word)) <= 2
+        ]
+        best = None
+        if indices:
+            best = process.extractOne(
+                word,
+                [vocab.fuzzy_words[i] for i in indices],
+                scorer=fuzz.WRatio,
+                score_cutoff=90,
+            )
+        matches.append(indices[best[2]] if best is not None else None)
+    return matches
+
+
+def apply_vocab_rules(text: str, vocab: VocabRules, fuzzy_enabled: bool) -> str:
+    if vocab.exact_pattern is None:
+        return text
+
+    terms_by_lower = vocab.terms_by_lower
+    updated = vocab.exact_pattern.sub(lambda m: terms_by_lower.get(m.group(0).lower(), m.group(0)), text)
 
-    if not fuzzy_enabled:
+    if not fuzzy_enabled or not vocab.fuzzy_words:
         return updated
 
-    words = re.findall(r"\b[\w'-]+\b", updated)
-    vocab_words = [t for t in vocab_terms if " " not in t]
-    if not vocab_words:
+    words = _WORD_RE.findall(updated)
+    unique_words = list(dict.fromkeys(words))
+    candidates = [
+        word
+        for word, lower in zip(unique_words, map(str.lower, unique_words))
+        if len(word) >= 5 and lower not in terms_by_lower
+    ]
+    if not candidates:
         return updated
 
     replacements: dict[str, str] = {}
-    for word in words:
-        if len(word) < 5 or word.lower() in terms_by_lower:
-            continue
-        best = process.extractOne(word, vocab_words, scorer=fuzz.WRatio, score_cutoff=90)
-        if best is None:
+    for word, idx in zip(candidates, best_fuzzy_matches(candidates, vocab)):
+        if idx is None:
             continue
-        candidate = best[0]
+        candidate = vocab.fuzzy_words[idx]
         if candidate.lower() != word.lower():
             replacements[word] = candidate
 
@@ -181,7 +378,26 @@ def apply_vocab_rules(text: str, vocab_terms: list[str], fuzzy_enabled: bool) ->
         token = match.group(0)
         return replacements.get(token, token)
 
-    return re.sub(r"\b[\w'-]+\b", repl, updated)
+    return _WORD_RE.sub(repl, updated)
+
+
+def write_and_drop(path: Path, text: str) -> None:
+    """
+    Write a write-once transcript and evict it from the page cache, so bulk runs
+    don't push model weights and inputs out of memory. Non-regular outputs such as
+    /dev/null or a FIFO are written as-is.
+    """
+    data = memoryview(text.encode("utf-8"))
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        while data:
+            data = data[os.write(fd, data) :]
+        if hasattr(os, "posix_fadvise") and stat.S_ISREG(os.fstat(fd).st_mode):
+            # Dirty pages cannot be dropped, so flush first.
+            os.fdatasync(fd)
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    finally:
+        os.close(fd)
 
 
 def to_markdown(text: str, source: Path, model_name: str, device: str) -> str:
@@ -194,119 +410,563 @@ def to_markdown(text: str, source: Path, model_name: str, device: str) -> str:
     )
 
 
-def safe_audio_duration_sec(path: Path) -> float | None:
-    try:
-        with wave.open(str(path), "rb") as wf:
-            rate = wf.getframerate()
-            if rate <= 0:
-                return None
-            return wf.getnframes() / float(rate)
-    except Exception:
-        return None
+class _Backend(Protocol):
+    def transcribe(self, audio: np.ndarray) -> str: ...
+
+    def transcribe_batch(self, audio: list[np.ndarray]) -> list[str | Exception]: ...
+
+    def compile(self) -> bool: ...
+
+    def uncompile(self) -> None: ...
+
+    def synchronize(self) -> None: ...
+
+
+def result_text(item: Any) -> str:
+    return item.text.strip() if hasattr(item, "text") else str(item).strip()
+
+
+class _TorchBackend(abc.ABC):
+    model: Any
+    _eager_encoder: Any = None
+
+    def __init__(self, model_name: str, device: str, precision: str) -> None:
+        self.device = device
+        self.precision = precision
+        self.model = self._load(model_name)
+
+    @abc.abstractmethod
+    def _load(self, model_name: str) -> Any:
+        """Load the model on `self.device` for inference in `self.precision`."""
+
+    def synchronize(self) -> None:
+        if self.device == "cuda":
+            import torch
+
+            torch.cuda.synchronize()
+
+    @contextlib.contextmanager
+    def _inference(self) -> Iterator[None]:
+        import torch
+
+        with torch.inference_mode():
+            yield
+
+    def transcribe(self, audio: np.ndarray) -> str:
+        result = self.transcribe_batch([audio])[0]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    @abc.abstractmethod
+    def transcribe_batch(self, audio: list[np.ndarray]) -> list[str | Exception]:
+        """One result per item; an item may carry its own exception instead of text."""
+
+    def compile(self) -> bool:
+        """
+        Compile the encoder with dynamic shapes. Default mode, not reduce-overhead:
+        CUDA graphs would be re-recorded for every new audio length. torch.compile is
+        lazy, so failures surface on the first call; callers warm up and `uncompile()`
+        on error. TDT decoding is a data-dependent Python loop and stays eager.
+        """
+        import torch
+
+        encoder = getattr(self.model, "encoder", None)
+        if encoder is None or self._eager_encoder is not None:
+            return False
+        self._eager_encoder = encoder
+        self.model.encoder = torch.compile(encoder, fullgraph=True, dynamic=True)
+        return True
+
+    def uncompile(self) -> None:
+        if self._eager_encoder is not None:
+            self.model.encoder = self._eager_encoder
+            self._eager_encoder = None
+
+
+class NanoParakeetBackend(_TorchBackend):
+    """Pure-PyTorch Parakeet port; no Lightning/Hydra/Lhotse initialization."""
+
+    def _load(self, model_name: str) -> Any:
+        import nano_parakeet
+
+        # nano casts encoder, decoder and joint to `dtype` together and keeps its
+        # mel preprocessor fp32, so no outer autocast is needed.
+        return nano_parakeet.from_pretrained(model_name, device=self.device, dtype=precision_dtype(self.precision))
+
+    def transcribe(self, audio: np.ndarray) -> str:
+        with self._inference():
+            return result_text(self.model.transcribe(audio))
+
+    def transcribe_batch(self, audio: list[np.ndarray]) -> list[str | Exception]:
+        """nano-parakeet has no batched transcribe; run items in turn so a bad input only fails itself."""
+        results: list[str | Exception] = []
+        for item in audio:
+            try:
+                results.append(self.transcribe(item))
+            except Exception as exc:
+                results.append(exc)
+        return results
+
 
+class NemoBackend(_TorchBackend):
+    """Reference NeMo runtime, kept as a fallback behind `--backend nemo`."""
 
-def load_model(model_name: str, device: str, verbose: bool) -> tuple[Any, str, float]:
+    def _load(self, model_name: str) -> Any:
+        patch_sampler_compat()
+        import nemo.collections.asr as nemo_asr
+
+        model = nemo_asr.models.ASRModel.from_pretrained(model_name=model_name, map_location="cpu")
+        if self.precision != "fp32":
+            # Store encoder weights in the autocast dtype so GEMMs skip per-call casts.
+            # Casting before the transfer also halves the bytes copied to the GPU.
+            model.encoder = model.encoder.to(dtype=precision_dtype(self.precision))
+        return model.to(self.device)
+
+    @contextlib.contextmanager
+    def _inference(self) -> Iterator[None]:
+        import torch
+
+        with super()._inference(), torch.autocast(
+            device_type=self.device,
+            dtype=precision_dtype(self.precision),
+            enabled=self.precision != "fp32",
+        ):
+            yield
+
+    def transcribe_batch(self, audio: list[np.ndarray]) -> list[str | Exception]:
+        batch_size = len(audio)
+        with self._inference():
+            try:
+                result = self.model.transcribe(audio=audio, batch_size=batch_size, num_workers=0, verbose=False)
+            except TypeError:
+                result = self._transcribe_files(audio)
+        if not result or len(result) != batch_size:
+            raise RuntimeError("empty transcription result")
+        return [result_text(item) for item in result]
+
+    def _transcribe_files(self, audio: list[np.ndarray]) -> Any:
+        """Older NeMo releases only accept file paths."""
+        import soundfile as sf
+
+        scratch = PARAKEET_HOME_DEFAULT / "tmp/scratch"
+        scratch.mkdir(exist_ok=True)
+        paths = [scratch / f"{os.getpid()}-{i}.wav" for i in range(len(audio))]
+        try:
+            for path, data in zip(paths, audio):
+                sf.write(str(path), data, SAMPLE_RATE, subtype="PCM_16")
+            return self.model.transcribe(
+                paths2audio_files=[str(p) for p in paths],
+                batch_size=len(paths),
+                num_workers=0,
+                verbose=False,
+            )
+        finally:
+            for path in paths:
+                path.unlink(missing_ok=True)
+
+
+BACKENDS: dict[str, type] = {
+    "nano": NanoParakeetBackend,
+    "nemo": NemoBackend,
+}
+
+
+@dataclass
+class LoadedModel:
+    backend: _Backend
+    backend_name: str
+    model_name: str
+    device: str
+    precision: str
+    load_sec: float
+
+    def serves(self, backend_name: str, model_name: str, device: str, precision: str) -> bool:
+        return (
+            self.backend_name == backend_name
+            and self.model_name == model_name
+            and self.device == device
+            and self.precision == precision
+        )
+
+
+def pick_backend(requested: str) -> str:
+    name = requested.lower()
+    if name not in BACKENDS:
+        raise RuntimeError(f"invalid --backend. allowed: {'|'.join(BACKENDS)}")
+    return name
+
+
+def load_model(
+    backend_name: str,
+    model_name: str,
+    device: str,
+    precision: str,
+    verbose: bool,
+) -> LoadedModel:
     t0 = time.perf_counter()
+    backend_name = pick_backend(backend_name)
     resolved_device = pick_device(device)
+    resolved_precision = pick_precision(precision, resolved_device)
     if verbose:
-        print(f"[parakeet] loading model: {model_name} on {resolved_device}", file=sys.stderr)
+        print(
+            f"[parakeet] loading model: {model_name} on {resolved_device} "
+            f"(backend={backend_name}, precision={resolved_precision})",
+            file=sys.stderr,
+        )
 
-    model = nemo_asr.models.ASRModel.from_pretrained(model_name=model_name)
-    model = model.to(torch.device(resolved_device))
-    return model, resolved_device, time.perf_counter() - t0
+    backend = BACKENDS[backend_name](model_name, resolved_device, resolved_precision)
+    backend.synchronize()
+    if resolved_device == "cuda":
+        import torch
+
+        # Allow TF32 for any fp32 matmuls. cudnn.benchmark stays off: audio lengths
+        # vary per request, so it would re-autotune on nearly every call.
+        torch.set_float32_matmul_precision("high")
+    return LoadedModel(
+        backend=backend,
+        backend_name=backend_name,
+        model_name=model_name,
+        device=resolved_device,
+        precision=resolved_precision,
+        load_sec=time.perf_counter() - t0,
+    )
 
 
-def transcribe(
-    req: dict[str, Any],
-    preloaded_model: Any | None = None,
-    preloaded_model_name: str | None = None,
-    preloaded_device: str | None = None,
-) -> dict[str, Any]:
-    patch_sampler_compat()
+@dataclass
+class PreparedRequest:
+    started: float
+    input_path: Path
+    output_path: Path | None
+    backend_name: str
+    model_name: str
+    device: str
+    precision: str
+    output_format: str
+    timestamps: bool
+    fuzzy_vocab: bool
+    verbose: bool
+    vocab: VocabRules
+    audio: np.ndarray
+
+    @property
+    def audio_sec(self) -> float:
+        return len(self.audio) / float(SAMPLE_RATE)
+
+
+def prepare_request(req: BackendRequest) -> PreparedRequest:
+    """Validate a request and decode its audio."""
     started = time.perf_counter()
-    parakeet_home = PARAKEET_HOME_DEFAULT
-    ensure_runtime_dirs(parakeet_home)
-
-    input_path = Path(req["input"]).expanduser().resolve()
-    if not input_path.exists():
-        raise RuntimeError(f"input file does not exist: {input_path}")
-
-    model_name = req["model"]
-    output_path = Path(req["output"]).expanduser().resolve() if req.get("output") else None
-    output_format = req["format"]
-    timestamps = bool(req["timestamps"])
-    fuzzy_vocab = bool(req["fuzzy_vocab"])
-    verbose = bool(req["verbose"])
-    vocab_path = Path(req["vocab"]).expanduser().resolve() if req.get("vocab") else None
-
-    vocab_terms = load_vocab(vocab_path)
-
-    tmp_dir = parakeet_home / "tmp"
-    tmp_dir.mkdir(parents=True, exist_ok=True)
-
-    with tempfile.TemporaryDirectory(dir=tmp_dir) as td:
-        normalized = normalize_audio(input_path, Path(td), verbose)
-        audio_duration = safe_audio_duration_sec(normalized)
-
-        model_load_sec = 0.0
-        if (
-            preloaded_model is not None
-            and preloaded_model_name == model_name
-            and preloaded_device == pick_device(req["device"])
-        ):
-            model = preloaded_model
-            resolved_device = preloaded_device
-        else:
-            model, resolved_device, model_load_sec = load_model(model_name, req["device"], verbose)
+    ensure_runtime_dirs(PARAKEET_HOME_DEFAULT)
 
-        infer_start = time.perf_counter()
-        audio_list = [str(normalized)]
-        try:
-            result = model.transcribe(paths2audio_files=audio_list, batch_size=1, num_workers=0, verbose=False)
-        except TypeError:
-            result = model.transcribe(audio=audio_list, batch_size=1, num_workers=0, verbose=False)
-        infer_sec = time.perf_counter() - infer_start
+    raw_input = Path(req.input).expanduser()
+    try:
+        # strict resolve doubles as the existence check (one path walk, no extra stat).
+        input_path = raw_input.resolve(strict=True)
+    except FileNotFoundError:
+        raise RuntimeError(f"input file does not exist: {raw_input.absolute()}") from None
+
+    backend_name = pick_backend(req.backend or DEFAULT_BACKEND)
+    device = pick_device(req.device)
+    precision = pick_precision(req.precision or "auto", device)
+    vocab_path = Path(req.vocab).expanduser().resolve() if req.vocab else None
+    vocab = load_vocab_rules(vocab_path)
+    verbose = bool(req.verbose)
+
+    return PreparedRequest(
+        started=started,
+        input_path=input_path,
+        output_path=Path(req.output).expanduser().resolve() if req.output else None,
+        backend_name=backend_name,
+        model_name=req.model,
+        device=device,
+        precision=precision,
+        output_format=req.format,
+        timestamps=bool(req.timestamps),
+        fuzzy_vocab=bool(req.fuzzy_vocab),
+        verbose=verbose,
+        vocab=vocab,
+        audio=load_and_normalize(input_path, verbose),
+    )
 
-        if not result:
-            raise RuntimeError("empty transcription result")
 
-        first = result[0]
-        text = first.text.strip() if hasattr(first, "text") else str(first).strip()
-        text = apply_vocab_rules(text, vocab_terms, fuzzy_vocab)
+def finish_request(
+    prep: PreparedRequest,
+    text: str,
+    loaded: LoadedModel,
+    model_load_sec: float,
+    infer_sec: float,
+) -> dict[str, Any]:
+    text = apply_vocab_rules(text, prep.vocab, prep.fuzzy_vocab)
 
-        if timestamps:
-            text = f"[timestamps not available in current simple mode]\n{text}"
+    if prep.timestamps:
+        text = f"[timestamps not available in current simple mode]\n{text}"
 
-        final_text = text if output_format == "text" else to_markdown(text, input_path, model_name, resolved_device)
+    final_text = (
+        text
+        if prep.output_format == "text"
+        else to_markdown(text, prep.input_path, prep.model_name, loaded.device)
+    )
 
-        if output_path:
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            output_path.write_text(final_text, encoding="utf-8")
+    output_path = prep.output_path
+    if output_path:
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        write_and_drop(output_path, final_text)
 
-    total_sec = time.perf_counter() - started
+    total_sec = time.perf_counter() - prep.started
     return {
         "transcript": final_text,
         "output_path": str(output_path) if output_path else None,
-        "source": str(input_path),
-        "model": model_name,
-        "device": resolved_device,
-        "format": output_format,
+        "source": str(prep.input_path),
+        "model": prep.model_name,
+        "device": loaded.device,
+        "format": prep.output_format,
         "metrics": {
             "model_load_sec": model_load_sec,
             "inference_sec": infer_sec,
             "total_sec": total_sec,
-            "audio_sec": audio_duration,
+            "audio_sec": prep.audio_sec,
         },
     }
 
 
-def serve(socket_path: Path, model_name: str, device: str, verbose: bool) -> int:
-    patch_sampler_compat()
-    parakeet_home = PARAKEET_HOME_DEFAULT
-    ensure_runtime_dirs(parakeet_home)
+def transcribe(req: BackendRequest, preloaded: LoadedModel | None = None) -> dict[str, Any]:
+    prep = prepare_request(req)
+    model_load_sec = 0.0
+    if preloaded is not None and preloaded.serves(prep.backend_name, prep.model_name, prep.device, prep.precision):
+        loaded = preloaded
+    else:
+        loaded = load_model(prep.backend_name, prep.model_name, prep.device, prep.precision, prep.verbose)
+        model_load_sec = loaded.load_sec
+
+    infer_start = time.perf_counter()
+    text = loaded.backend.transcribe(prep.audio)
+    infer_sec = time.perf_counter() - infer_start
+    return finish_request(prep, text, loaded, model_load_sec, infer_sec)
+
 
-    model, resolved_device, load_sec = load_model(model_name, device, verbose)
+def transcribe_batch(reqs: list[BackendRequest], loaded: LoadedModel) -> list[dict[str, Any] | Exception]:
+    """
+    Transcribe several daemon requests with one backend call (only NeMo batches on
+    the device; nano runs them in turn). Requests for a different
+    backend/model/device/precision than `loaded` get an error, so the CLI falls back
+    to its one-shot path instead of the daemon loading a second model.
+    """
+    results: list[dict[str, Any] | Exception | None] = [None] * len(reqs)
+    batch: list[tuple[int, PreparedRequest]] = []
+    for i, req in enumerate(reqs):
+        try:
+            prep = prepare_request(req)
+        except Exception as exc:
+            results[i] = exc
+            continue
+        if loaded.serves(prep.backend_name, prep.model_name, prep.device, prep.precision):
+            batch.append((i, prep))
+            continue
+        results[i] = RuntimeError(
+            f"daemon serves backend={loaded.backend_name} model={loaded.model_name} "
+            f"device={loaded.device} precision={loaded.precision}; request needs "
+            f"backend={prep.backend_name} model={prep.model_name} "
+            f"device={prep.device} precision={prep.precision}"
+        )
+
+    if batch:
+        try:
+            infer_start = time.perf_counter()
+            texts = loaded.backend.transcribe_batch([prep.audio for _, prep in batch])
+            infer_sec = time.perf_counter() - infer_start
+        except Exception as exc:
+            for i, _ in batch:
+                results[i] = exc
+        else:
+            for (i, prep), text in zip(batch, texts):
+                if isinstance(text, Exception):
+                    results[i] = text
+                    continue
+                try:
+                    results[i] = finish_request(prep, text, loaded, 0.0, infer_sec)
+                except Exception as exc:
+                    results[i] = exc
+
+    return [r if r is not None else RuntimeError("request was not processed") for r in results]
+
+
+def warmup(loaded: LoadedModel, compiled: bool, verbose: bool) -> None:
+    """
+    Run 1s of silence through the model so compilation is paid
+    before the first client.
+    """
+    silence = np.zeros(SAMPLE_RATE, dtype=np.float32)
+    t0 = time.perf_counter()
+    try:
+        loaded.backend.transcribe(silence)
+    except Exception as exc:
+        if not compiled:
+            raise
+        print(f"[parakeetd] torch.compile failed, falling back to eager: {exc}", file=sys.stderr)
+        loaded.backend.uncompile()
+        loaded.backend.transcribe(silence)
+    if verbose:
+        print(f"[parakeetd] warmup done in {time.perf_counter() - t0:.2f}s", file=sys.stderr)
+
+
+def encode_json(payload: dict[str, Any]) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
+
+def send_json(conn: socket.socket, payload: dict[str, Any], framed: bool = False) -> None:
+    """Reply in the request's framing; one vectored write, no concatenation copy."""
+    data = encode_json(payload)
+    parts = [FRAME_HEADER.pack(FRAME_V1, len(data)), data] if framed else [data, b"\n"]
+    try:
+        sent = conn.sendmsg(parts)
+        total = sum(map(len, parts))
+        if sent < total:
+            conn.sendall(memoryview(b"".join(parts))[sent:])
+    except OSError as send_exc:
+        if send_exc.errno not in {errno.EPIPE, errno.ECONNRESET, errno.ENOTCONN}:
+            raise
+
+
+class IncomingRequest:
+    """
+    Per-connection read state. Framed requests are FRAME_V1, a big-endian u32 length and
+    the JSON body, which is read with recv_into into a preallocated buffer. Anything else
+    is a legacy newline-terminated JSON line.
+    """
+
+    __slots__ = ("head", "body", "filled", "framed")
+
+    def __init__(self) -> None:
+        self.head = bytearray()
+        self.body: bytearray | None = None
+        self.filled = 0
+        self.framed = False
+
+    def read_from(self, conn: socket.socket) -> bool:
+        """Drain readable bytes; True once the request is complete or the peer closed."""
+        while True:
+            if self.body is not None:
+                if self.filled == len(self.body):
+                    return True
+                try:
+                    n = conn.recv_into(memoryview(self.body)[self.filled :])
+                except BlockingIOError:
+                    return False
+                except OSError:
+                    n = 0
+                if n == 0:
+                    return True
+                self.filled += n
+                continue
+
+            try:
+                chunk = conn.recv(65536)
+            except BlockingIOError:
+                return False
+            except OSError:
+                chunk = b""
+            if not chunk:
+                return True
+            self.head.extend(chunk)
+            if self.head[0] == FRAME_V1:
+                self.framed = True
+                if len(self.head) >= FRAME_HEADER.size:
+                    _, length = FRAME_HEADER.unpack_from(self.head)
+                    if length > MAX_FRAME_BYTES:
+                        raise RuntimeError(f"request frame too large: {length} bytes")
+                    self.body = bytearray(length)
+                    received = self.head[FRAME_HEADER.size : FRAME_HEADER.size + length]
+                    self.body[: len(received)] = received
+                    self.filled = len(received)
+            elif b"\n" in chunk:
+                return True
+
+    def is_empty(self) -> bool:
+        return not self.head
+
+    def payload(self) -> bytes:
+        if self.framed:
+            if self.body is None or self.filled < len(self.body):
+                raise RuntimeError("truncated request frame")
+            raw = self.body
+        else:
+            raw = self.head.split(b"\n", 1)[0]
+        return bytes(raw.strip())
+
+
+def read_requests(
+    server: socket.socket,
+    pending: queue.Queue[tuple[socket.socket, BackendRequest, bool]],
+) -> None:
+    """
+    Multiplex client sockets with a selector (epoll on Linux) so slow writers don't
+    block others. Each fully received request is handed to the batching worker.
+    """
+    sel = selectors.DefaultSelector()
+    server.setblocking(False)
+    sel.register(server, selectors.EVENT_READ, None)
+
+    while True:
+        for key, _ in sel.select():
+            if key.data is None:
+                try:
+                    conn, _ = server.accept()
+                except BlockingIOError:
+                    continue
+                conn.setblocking(False)
+                sel.register(conn, selectors.EVENT_READ, IncomingRequest())
+                continue
+
+            conn = key.fileobj
+            incoming = key.data
+            try:
+                if not incoming.read_from(conn):
+                    continue
+                error = None
+            except Exception as exc:
+                error = exc
+
+            sel.unregister(conn)
+            conn.setblocking(True)
+            if error is None and incoming.is_empty():
+                conn.close()
+                continue
+            try:
+                if error is not None:
+                    raise error
+                req = read_request(incoming.payload())
+            except Exception as exc:
+                with conn:
+                    send_json(conn, {"error": str(exc)}, incoming.framed)
+                continue
+            pending.put((conn, req, incoming.framed))
+
+
+def serve(
+    socket_path: Path,
+    backend_name: str,
+    model_name: str,
+    device: str,
+    precision: str,
+    verbose: bool,
+    compile_model: bool = True,
+    max_batch: int = 8,
+    batch_wait_ms: float = 10.0,
+) -> int:
+    ensure_runtime_dirs(PARAKEET_HOME_DEFAULT)
     socket_path.parent.mkdir(parents=True, exist_ok=True)
+
+    loaded = load_model(backend_name, model_name, device, precision, verbose)
+    compiled = compile_model and loaded.device == "cuda" and loaded.backend.compile()
+    if compiled and verbose:
+        print("[parakeetd] compiled encoder (dynamic shapes)", file=sys.stderr)
+    warmup(loaded, compiled, verbose)
+    loaded.backend.synchronize()
+
+    # Bind only once warm: the CLI treats an existing socket as a ready daemon.
     try:
         if socket_path.exists():
             socket_path.unlink()
@@ -317,50 +977,56 @@ def serve(socket_path: Path, model_name: str, device: str, verbose: bool) -> int
     server.bind(str(socket_path))
     server.listen(16)
     print(
-        f"[parakeetd] ready socket={socket_path} model={model_name} device={resolved_device} load_sec={load_sec:.2f}",
+        f"[parakeetd] ready socket={socket_path} backend={loaded.backend_name} model={model_name} "
+        f"device={loaded.device} precision={loaded.precision} load_sec={loaded.load_sec:.2f}",
         file=sys.stderr,
         flush=True,
     )
 
+    pending: queue.Queue[tuple[socket.socket, BackendRequest, bool]] = queue.Queue(maxsize=64)
+    threading.Thread(target=read_requests, args=(server, pending), daemon=True).start()
+
     while True:
-        conn, _ = server.accept()
-        with conn:
+        items = [pending.get()]
+        deadline = time.monotonic() + batch_wait_ms / 1000.0
+        while len(items) < max_batch:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
             try:
-                data = b""
-                while not data.endswith(b"\n"):
-                    chunk = conn.recv(65536)
-                    if not chunk:
-                        break
-                    data += chunk
-                if not data:
-                    continue
+                items.append(pending.get(timeout=remaining))
+            except queue.Empty:
+                break
 
-                req = read_request(data.decode("utf-8", errors="ignore").strip())
-                result = transcribe(
-                    req,
-                    preloaded_model=model,
-                    preloaded_model_name=model_name,
-                    preloaded_device=resolved_device,
-                )
-                conn.sendall((json.dumps(result, ensure_ascii=False) + "\n").encode("utf-8"))
-            except Exception as exc:
-                payload = {"error": str(exc)}
-                try:
-                    conn.sendall((json.dumps(payload, ensure_ascii=False) + "\n").encode("utf-8"))
-                except OSError as send_exc:
-                    if send_exc.errno not in {errno.EPIPE, errno.ECONNRESET, errno.ENOTCONN}:
-                        raise
+        results = transcribe_batch([req for _, req, _ in items], loaded)
+        for (conn, _, framed), result in zip(items, results):
+            with conn:
+                if isinstance(result, Exception):
+                    send_json(conn, {"error": str(result)}, framed)
+                else:
+                    send_json(conn, result, framed)
 
 
 def main() -> int:
     args = parse_args()
     try:
         if args.serve:
-            return serve(Path(args.socket_path), args.service_model, args.service_device, args.verbose)
+            return serve(
+                Path(args.socket_path),
+                args.service_backend,
+                args.service_model,
+                args.service_device,
+                args.service_precision,
+                args.verbose,
+                compile_model=args.service_compile,
+                max_batch=args.service_max_batch,
+                batch_wait_ms=args.service_batch_wait_ms,
+            )
 
         req = read_request(args.json)
         result = transcribe(req)
-        print(json.dumps(result, ensure_ascii=False))
+        sys.stdout.buffer.write(encode_json(result) + b"\n")
+        sys.stdout.flush()
         return 0
     except Exception as exc:
         print(str(exc), file=sys.stderr)
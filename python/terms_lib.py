@@ -1,18 +1,48 @@
 #!/usr/bin/env python3
 import argparse
+import contextlib
+import functools
+import heapq
+import itertools
 import json
 import math
 import os
 import re
 import sqlite3
+import stat
 import time
+import unicodedata
+from array import array
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Iterable
-
-from rapidfuzz import fuzz
-
-WORD_RE = re.compile(r"[A-Za-zА-Яа-яІіЇїЄєҐґ0-9][A-Za-zА-Яа-яІіЇїЄєҐґ0-9_'’.-]{2,}")
+from typing import Any, Iterable, Iterator
+
+import regex
+from rapidfuzz import fuzz, process
+
+try:
+    import orjson
+except ImportError:  # optional: faster JSON encoding straight to bytes
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # optional: stream large JSON files instead of loading them whole
+    ijson = None
+
+# Any script's letters/digits; possessive quantifiers never backtrack into a run.
+WORD_RE = regex.compile(r"[\p{L}\p{N}][\p{L}\p{N}_'’.-]{2,}+")
+# Product/domain names with separators, e.g. parakeet-cli or foo/bar.
+COMPOUND_RE = regex.compile(r"\b[\p{L}\p{N}]++(?:[-_/][\p{L}\p{N}]++)++\b")
+# One scan for both shapes; compounds go first so they are not split at "/".
+CANDIDATE_RE = regex.compile(f"{COMPOUND_RE.pattern}|{WORD_RE.pattern}")
+WS_RE = re.compile(r"\s+")
+NUMERIC_RE = re.compile(r"[0-9_.-]+")
+TLD_RE = re.compile(r"\.(com|net|org|us|io)$")
+BLOB_RE = re.compile(r"[A-Za-z0-9+/=]{20,}")
+LATIN_NAME_RE = re.compile(r"[A-Z][A-Za-z'’-]{3,}")
 STOPWORDS = {
     "the", "and", "for", "with", "that", "this", "from", "have", "you", "your", "are", "was", "were",
     "what", "when", "where", "will", "would", "could", "should", "into", "about", "there", "their", "then",
@@ -28,6 +58,10 @@ STOPWORDS = {
 TEXT_EXTS = {".txt", ".md", ".json", ".log", ".csv", ".yaml", ".yml"}
 SKIP_DIRS = {".git", "target", "node_modules", ".venv", "__pycache__", "media", ".cache"}
 MAX_FILES_PER_DIR_SCAN = 8000
+# Below this many files a process pool costs more to start than it saves.
+PARALLEL_MIN_FILES = 32
+# Token helpers below are pure and see heavily repeated inputs (Zipfian text).
+TOKEN_CACHE_SIZE = 200_000
 BAD_SUBSTRINGS = {
     "display_name",
     "speaker_name",
@@ -43,18 +77,95 @@ BAD_SUBSTRINGS = {
 class TermStats:
     term: str
     count: int
-    channels: dict[str, int]
+    channels: Counter[str]
     last_seen: float
 
     def to_dict(self) -> dict[str, Any]:
         return {
             "term": self.term,
             "count": self.count,
-            "channels": self.channels,
+            "channels": dict(self.channels),
             "last_seen": self.last_seen,
         }
 
 
+class TermTable:
+    """
+    The term library as parallel arrays indexed by row (struct-of-arrays), which
+    is far smaller than one TermStats object per term and keeps the ranking scans
+    over counts/last_seen on contiguous memory. `count_delta`/`channel_delta` hold
+    the increments since the last LibraryDB.save, which applies them as deltas.
+    The KeyIndex for merging is built on first use and then kept current by `add()`.
+    """
+
+    __slots__ = (
+        "key_to_idx",
+        "keys",
+        "terms",
+        "counts",
+        "last_seen",
+        "channels",
+        "count_delta",
+        "channel_delta",
+        "_index",
+    )
+
+    def __init__(self) -> None:
+        self.key_to_idx: dict[str, int] = {}
+        self.keys: list[str] = []
+        self.terms: list[str] = []
+        self.counts = array("Q")
+        self.last_seen = array("d")
+        self.channels: list[Counter[str]] = []
+        self.count_delta: Counter[int] = Counter()
+        self.channel_delta: dict[int, Counter[str]] = {}
+        self._index: KeyIndex | None = None
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def add(self, key: str, term: str, count: int = 0, last_seen: float = 0.0) -> int:
+        i = len(self.keys)
+        self.key_to_idx[key] = i
+        self.keys.append(key)
+        self.terms.append(term)
+        self.counts.append(count)
+        self.last_seen.append(last_seen)
+        self.channels.append(Counter())
+        if self._index is not None:
+            self._index.add(key)
+        return i
+
+    def key_index(self) -> "KeyIndex":
+        if self._index is None:
+            self._index = KeyIndex(self.keys)
+        return self._index
+
+    def bump(self, i: int, channel: str, n: int, now: float) -> None:
+        self.counts[i] += n
+        self.channels[i][channel] += n
+        self.last_seen[i] = now
+        self.count_delta[i] += n
+        self.channel_delta.setdefault(i, Counter())[channel] += n
+
+    def mark_all_pending(self) -> None:
+        """Treat every row as new, e.g. when importing into an empty database."""
+        self.count_delta = Counter(dict(enumerate(self.counts)))
+        self.channel_delta = {i: Counter(ch) for i, ch in enumerate(self.channels)}
+
+    def clear_pending(self) -> None:
+        self.count_delta.clear()
+        self.channel_delta.clear()
+
+    def row(self, i: int) -> TermStats:
+        return TermStats(
+            term=self.terms[i],
+            count=self.counts[i],
+            channels=self.channels[i],
+            last_seen=self.last_seen[i],
+        )
+
+
 def parse_args() -> argparse.Namespace:
     p = argparse.ArgumentParser(description="Parakeet terms library manager")
     sub = p.add_subparsers(dest="cmd", required=True)
@@ -81,6 +192,9 @@ def parse_args() -> argparse.Namespace:
     stats.add_argument("--top", type=int, default=30)
 
     sub.add_parser("rebuild", help="Run ingest-auto + build-vocab")
+
+    export = sub.add_parser("export-json", help="Export the terms library as JSON")
+    export.add_argument("--path", default=str(lib_path()))
     return p.parse_args()
 
 
@@ -101,6 +215,10 @@ def lib_path() -> Path:
     return terms_dir() / "library.json"
 
 
+def db_path() -> Path:
+    return terms_dir() / "library.db"
+
+
 def manual_path() -> Path:
     return terms_dir() / "manual.txt"
 
@@ -113,60 +231,152 @@ def merged_vocab_path() -> Path:
     return terms_dir() / "vocab.txt"
 
 
-def load_library() -> dict[str, TermStats]:
-    p = lib_path()
+def load_library_json(p: Path) -> TermTable:
+    out = TermTable()
     if not p.exists():
-        return {}
-    raw = json.loads(p.read_text(encoding="utf-8"))
-    out: dict[str, TermStats] = {}
+        return out
+    data = p.read_bytes()
+    raw = orjson.loads(data) if orjson is not None else json.loads(data)
     for k, v in raw.items():
-        out[k] = TermStats(
-            term=v["term"],
-            count=int(v.get("count", 0)),
-            channels={str(ch): int(cnt) for ch, cnt in v.get("channels", {}).items()},
-            last_seen=float(v.get("last_seen", 0)),
-        )
+        i = out.add(k, v["term"], int(v.get("count", 0)), float(v.get("last_seen", 0)))
+        out.channels[i].update({str(ch): int(cnt) for ch, cnt in v.get("channels", {}).items()})
     return out
 
 
-def save_library(lib: dict[str, TermStats]) -> None:
-    payload = {k: v.to_dict() for k, v in lib.items()}
-    lib_path().write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+def encode_json(payload: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+    return json.dumps(payload, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def export_library_json(lib: TermTable, p: Path) -> None:
+    payload = {k: lib.row(i).to_dict() for i, k in enumerate(lib.keys)}
+    # Write aside and rename so a crash mid-write never leaves a truncated file.
+    tmp = p.with_suffix(".json.tmp")
+    tmp.write_bytes(encode_json(payload))
+    os.replace(tmp, p)
+
+
+class LibraryDB:
+    """
+    Term library stored in SQLite. Commands still work on the in-memory table from
+    `load()`, but `save()` only writes touched rows, so an ingest costs I/O
+    proportional to what it touched rather than to the library size. Counts are
+    applied as SQL-side increments, so concurrent ingests (WAL) do not lose updates.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS terms (
+            key TEXT PRIMARY KEY,
+            term TEXT NOT NULL,
+            count INTEGER NOT NULL,
+            last_seen REAL NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS channels (
+            key TEXT NOT NULL,
+            channel TEXT NOT NULL,
+            cnt INTEGER NOT NULL,
+            PRIMARY KEY (key, channel)
+        );
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.conn = sqlite3.connect(str(path), timeout=30.0)
+        self.conn.create_function("signal_score", 1, signal_score, deterministic=True)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(self.SCHEMA)
+
+    def load(self) -> TermTable:
+        lib = TermTable()
+        for key, term, count, last_seen in self.conn.execute("SELECT key, term, count, last_seen FROM terms"):
+            lib.add(key, term, count, last_seen)
+        for key, channel, cnt in self.conn.execute("SELECT key, channel, cnt FROM channels"):
+            i = lib.key_to_idx.get(key)
+            if i is not None:
+                lib.channels[i][channel] = cnt
+        if not lib and lib_path().exists():
+            # One-time migration from the JSON library.
+            lib = load_library_json(lib_path())
+            lib.mark_all_pending()
+            with self.conn:
+                self.conn.execute("BEGIN IMMEDIATE")
+                # Another process may have migrated since the read above.
+                migrated = self.conn.execute("SELECT 1 FROM terms LIMIT 1").fetchone() is not None
+                if not migrated:
+                    self._apply(lib)
+            if migrated:
+                return self.load()
+            lib.clear_pending()
+        return lib
+
+    def save(self, lib: TermTable) -> None:
+        if not lib.count_delta:
+            return
+        with self.conn:
+            self._apply(lib)
+        lib.clear_pending()
+
+    def _apply(self, lib: TermTable) -> None:
+        rows = sorted(lib.count_delta)
+        self.conn.executemany(
+            "INSERT INTO terms(key, term, count, last_seen) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET "
+            "count = count + excluded.count, "
+            "last_seen = max(last_seen, excluded.last_seen), "
+            "term = CASE WHEN signal_score(excluded.term) > signal_score(term) THEN excluded.term ELSE term END",
+            [(lib.keys[i], lib.terms[i], lib.count_delta[i], lib.last_seen[i]) for i in rows],
+        )
+        self.conn.executemany(
+            "INSERT INTO channels(key, channel, cnt) VALUES (?, ?, ?) "
+            "ON CONFLICT(key, channel) DO UPDATE SET cnt = cnt + excluded.cnt",
+            [(lib.keys[i], ch, cnt) for i in rows for ch, cnt in lib.channel_delta.get(i, {}).items()],
+        )
 
 
+@functools.lru_cache(maxsize=TOKEN_CACHE_SIZE)
 def normalize_token(tok: str) -> str:
     cleaned = tok.strip(" _-.,:;!?()[]{}\"'`“”‘’")
-    cleaned = re.sub(r"\s+", " ", cleaned)
+    cleaned = WS_RE.sub(" ", cleaned)
     return cleaned
 
 
+@functools.lru_cache(maxsize=TOKEN_CACHE_SIZE)
 def key_for(tok: str) -> str:
     return normalize_token(tok).lower().replace("’", "'")
 
 
+@functools.lru_cache(maxsize=TOKEN_CACHE_SIZE)
 def looks_useful(tok: str) -> bool:
-    t = normalize_token(tok)
+    return _looks_useful_normalized(normalize_token(tok))
+
+
+@functools.lru_cache(maxsize=TOKEN_CACHE_SIZE)
+def _looks_useful_normalized(t: str) -> bool:
+    # `t` must already be normalize_token output; hot-path callers have normalized.
     if len(t) < 3:
         return False
-    k = key_for(t)
+    lower = t.lower()
+    k = lower.replace("’", "'")
     if not k or k in STOPWORDS:
         return False
     if t.isdigit():
         return False
-    if re.fullmatch(r"[0-9_.-]+", t):
+    if NUMERIC_RE.fullmatch(t):
         return False
     if "@" in t or t.startswith("http"):
         return False
-    if re.search(r"\.(com|net|org|us|io)$", t.lower()):
+    if TLD_RE.search(lower):
         return False
-    if "_" in t and t.lower() == t:
+    if "_" in t and lower == t:
         return False
     return True
 
 
+@functools.lru_cache(maxsize=TOKEN_CACHE_SIZE)
 def looks_vocab_candidate(tok: str) -> bool:
     t = normalize_token(tok)
-    if not looks_useful(t):
+    if not _looks_useful_normalized(t):
         return False
     k = key_for(t)
     if k in {"display_name", "matched_calendar_invitee_email", "speaker_name", "recording_id"}:
@@ -192,7 +402,7 @@ def hard_term_score(stats: TermStats) -> float:
     multi_word = 2 <= len(words) <= 4
     non_ascii = any(ord(c) > 127 for c in t)
     lowercase_single = len(words) == 1 and t.isalpha() and t == lower
-    latin_title_name = bool(re.fullmatch(r"[A-Z][A-Za-z'’-]{3,}", t))
+    latin_title_name = bool(LATIN_NAME_RE.fullmatch(t))
 
     # Hard-negative filters.
     if len(t) > 48:
@@ -201,11 +411,11 @@ def hard_term_score(stats: TermStats) -> float:
         return -1.0
     if any(x in lower for x in BAD_SUBSTRINGS):
         return -1.0
-    if re.search(r"\.(com|net|org|us|io)$", lower):
+    if TLD_RE.search(lower):
         return -1.0
     if "@" in t or t.startswith("http"):
         return -1.0
-    if re.fullmatch(r"[A-Za-z0-9+/=]{20,}", t):
+    if BLOB_RE.fullmatch(t):
         return -1.0
 
     feature = 0.0
@@ -243,77 +453,162 @@ def hard_term_score(stats: TermStats) -> float:
 
 def extract_terms(text: str) -> list[str]:
     candidates = []
-    for m in WORD_RE.finditer(text):
-        tok = normalize_token(m.group(0))
-        if looks_useful(tok):
-            candidates.append(tok)
-
-    # Capture likely product/domain names with separators.
-    for m in re.finditer(r"\b[A-Za-z0-9]+(?:[-_/][A-Za-z0-9]+)+\b", text):
+    for m in CANDIDATE_RE.finditer(text):
         tok = normalize_token(m.group(0))
-        if looks_useful(tok):
+        if _looks_useful_normalized(tok):
             candidates.append(tok)
     return candidates
 
 
-def nearest_existing_key(new_key: str, existing: Iterable[str]) -> str | None:
-    best_key = None
-    best_score = 0
-    for ex in existing:
-        if abs(len(ex) - len(new_key)) > 2:
+def canonical_key(key: str) -> str:
+    return unicodedata.normalize("NFKD", key).replace("-", "").replace("_", "")
+
+
+class KeyIndex:
+    """
+    Lookup index for merging new keys into existing ones. Keys that only differ
+    by separators or Unicode compatibility forms resolve through an exact
+    `canonical` map. Otherwise keys are filed under (length, first two chars) and
+    (length, last two chars), and a new key is only fuzzy-scored against keys
+    within +/-2 chars of its length that share its head or its tail.
+    """
+
+    def __init__(self, keys: Iterable[str] = ()) -> None:
+        self.canonical: dict[str, str] = {}
+        self.by_prefix: dict[tuple[int, str], list[str]] = {}
+        self.by_suffix: dict[tuple[int, str], list[str]] = {}
+        for k in keys:
+            self.add(k)
+
+    def add(self, key: str) -> None:
+        self.canonical.setdefault(canonical_key(key), key)
+        n = len(key)
+        self.by_prefix.setdefault((n, key[:2]), []).append(key)
+        self.by_suffix.setdefault((n, key[-2:]), []).append(key)
+
+    def candidates(self, key: str) -> list[str]:
+        n, head, tail = len(key), key[:2], key[-2:]
+        blocks = []
+        for size in range(n - 2, n + 3):
+            blocks.append(self.by_prefix.get((size, head), ()))
+            blocks.append(self.by_suffix.get((size, tail), ()))
+        return list(dict.fromkeys(itertools.chain.from_iterable(blocks)))
+
+    def match_batch(self, keys: list[str]) -> dict[str, str]:
+        """
+        Fuzzy-match many new keys at once. New keys sharing a block are scored
+        together with one multithreaded `process.cdist` call against that block's
+        candidates, instead of one extractOne call per key.
+        """
+        best: dict[str, tuple[float, str]] = {}
+        for blocks, prefix in ((self.by_prefix, True), (self.by_suffix, False)):
+            groups: dict[tuple[int, str], list[str]] = {}
+            for k in keys:
+                groups.setdefault((len(k), k[:2] if prefix else k[-2:]), []).append(k)
+            for (n, affix), group in groups.items():
+                candidates = [c for size in range(n - 2, n + 3) for c in blocks.get((size, affix), ())]
+                if not candidates:
+                    continue
+                scores = process.cdist(group, candidates, scorer=fuzz.ratio, score_cutoff=94, workers=-1)
+                cols = scores.argmax(axis=1)
+                for row, k in enumerate(group):
+                    score = float(scores[row, cols[row]])
+                    if score >= 94 and score > best.get(k, (0.0, ""))[0]:
+                        best[k] = (score, candidates[cols[row]])
+        return {k: match for k, (_, match) in best.items()}
+
+
+def nearest_existing_key(new_key: str, index: KeyIndex) -> str | None:
+    exact = index.canonical.get(canonical_key(new_key))
+    if exact is not None:
+        return exact
+    candidates = index.candidates(new_key)
+    if not candidates:
+        return None
+    hit = process.extractOne(new_key, candidates, scorer=fuzz.ratio, score_cutoff=94)
+    return hit[0] if hit is not None else None
+
+
+def aggregate_terms(terms: Iterable[str]) -> tuple[Counter[str], dict[str, str]]:
+    """Count useful tokens by key, keeping the highest-signal spelling seen for each."""
+    counts: Counter[str] = Counter()
+    canonical: dict[str, str] = {}
+    for raw in terms:
+        tok = normalize_token(raw)
+        if not _looks_useful_normalized(tok):
             continue
-        score = fuzz.ratio(new_key, ex)
-        if score >= 94 and score > best_score:
-            best_score = score
-            best_key = ex
-    return best_key
+        k = key_for(tok)
+        counts[k] += 1
+        best = canonical.get(k)
+        if best is None or signal_score(tok) > signal_score(best):
+            canonical[k] = tok
+    return counts, canonical
 
 
-def add_terms(lib: dict[str, TermStats], terms: list[str], channel: str) -> int:
+def merge_counts(lib: TermTable, counts: Counter[str], canonical: dict[str, str], channel: str) -> int:
+    """Fold pre-aggregated counts into the library, one update per unique key."""
     now = time.time()
     added = 0
-    keys = set(lib.keys())
-
-    for raw in terms:
-        tok = normalize_token(raw)
-        if not looks_useful(tok):
-            continue
 
-        k = key_for(tok)
-        if k not in keys:
-            merge_key = nearest_existing_key(k, keys)
-            if merge_key is not None:
-                k = merge_key
-
-        entry = lib.get(k)
-        if entry is None:
-            entry = TermStats(term=tok, count=0, channels={}, last_seen=now)
-            lib[k] = entry
-            keys.add(k)
+    # Resolve every key before updating anything: exact and canonical hits first,
+    # then one batched fuzzy pass over the rest against the existing library.
+    # Exact hits never touch the KeyIndex, so it is only built when needed.
+    rows: dict[str, int] = {}
+    pending: list[str] = []
+    for k in counts:
+        i = lib.key_to_idx.get(k)
+        if i is None:
+            hit = lib.key_index().canonical.get(canonical_key(k))
+            if hit is None:
+                pending.append(k)
+                continue
+            i = lib.key_to_idx[hit]
+        rows[k] = i
+    matches = lib.key_index().match_batch(pending) if pending else {}
+    # Keys that match nothing existing can still cluster with each other.
+    batch = KeyIndex()
+    for k in pending:
+        merge_key = matches.get(k) or nearest_existing_key(k, batch)
+        if merge_key is not None:
+            rows[k] = lib.key_to_idx[merge_key]
+        else:
+            rows[k] = lib.add(k, canonical[k])
+            batch.add(k)
             added += 1
 
-        entry.count += 1
-        entry.channels[channel] = entry.channels.get(channel, 0) + 1
-        entry.last_seen = now
+    for k, n in counts.items():
+        tok = canonical[k]
+        i = rows[k]
+        lib.bump(i, channel, n, now)
 
         # Prefer canonical spelling if this variant has more uppercase/special signal.
-        if signal_score(tok) > signal_score(entry.term):
-            entry.term = tok
+        if signal_score(tok) > signal_score(lib.terms[i]):
+            lib.terms[i] = tok
 
     return added
 
 
+def add_terms(lib: TermTable, terms: Iterable[str], channel: str) -> int:
+    counts, canonical = aggregate_terms(terms)
+    return merge_counts(lib, counts, canonical, channel)
+
+
+@functools.lru_cache(maxsize=TOKEN_CACHE_SIZE)
 def signal_score(term: str) -> int:
-    score = 0
-    if any(c.isupper() for c in term):
-        score += 2
-    if any(c.isdigit() for c in term):
-        score += 1
-    if any(c in "-_/" for c in term):
-        score += 1
-    if len(term) >= 6:
-        score += 1
-    return score
+    # One scan for all three character classes, stopping once every flag is set.
+    upper = digit = sep = False
+    for c in term:
+        if not upper and c.isupper():
+            upper = True
+        elif not digit and c.isdigit():
+            digit = True
+        elif not sep and c in "-_/":
+            sep = True
+        else:
+            continue
+        if upper and digit and sep:
+            break
+    return 2 * upper + digit + sep + (len(term) >= 6)
 
 
 def read_text_file(path: Path) -> str:
@@ -341,75 +636,186 @@ def extract_json_values(value: Any) -> list[str]:
     return out
 
 
-def ingest_file(lib: dict[str, TermStats], path: Path, channel: str) -> int:
-    if not path.exists() or not path.is_file():
-        return 0
-    if path.suffix.lower() not in TEXT_EXTS and path.stat().st_size > 5_000_000:
-        return 0
+def iter_json_file_terms(path: Path) -> Iterator[str]:
+    """Yield terms from every string value in a JSON file as the parser reaches it."""
+    with path.open("rb") as f:
+        for _, event, value in ijson.parse(f):
+            if event == "string" and len(value) >= 3:
+                yield from extract_terms(value)
+
+
+def iter_text_file_terms(path: Path, encoding: str) -> Iterator[str]:
+    # Line by line keeps peak memory at one line; terms never span a newline.
+    with path.open("r", encoding=encoding) as f:
+        for line in f:
+            yield from extract_terms(line)
+
+
+def file_term_counts(path: Path, size: int | None = None) -> tuple[Counter[str], dict[str, str]]:
+    if size is None:
+        try:
+            st = path.stat()
+        except OSError:
+            return Counter(), {}
+        if not stat.S_ISREG(st.st_mode):
+            return Counter(), {}
+        size = st.st_size
+    if path.suffix.lower() not in TEXT_EXTS and size > 5_000_000:
+        return Counter(), {}
     if path.suffix.lower() == ".json":
-        text = read_text_file(path)
-        if not text:
-            return 0
         try:
+            if ijson is not None:
+                # Fully aggregated before returning, so a parse error part-way through
+                # falls back to plain text without double-counting.
+                return aggregate_terms(iter_json_file_terms(path))
+            text = read_text_file(path)
+            if not text:
+                return Counter(), {}
             payload = json.loads(text)
             terms: list[str] = []
             for v in extract_json_values(payload):
                 terms.extend(extract_terms(v))
-            return add_terms(lib, terms, channel)
+            return aggregate_terms(terms)
         except Exception:
             pass
 
-    text = read_text_file(path)
-    if not text:
-        return 0
-    return add_terms(lib, extract_terms(text), channel)
+    try:
+        return aggregate_terms(iter_text_file_terms(path, "utf-8"))
+    except UnicodeDecodeError:
+        try:
+            return aggregate_terms(iter_text_file_terms(path, "latin-1"))
+        except Exception:
+            return Counter(), {}
+    except Exception:
+        return Counter(), {}
 
 
-def ingest_text_dir(lib: dict[str, TermStats], folder: Path, channel: str) -> int:
-    if not folder.exists():
+def ingest_file(lib: TermTable, path: Path, channel: str, size: int | None = None) -> int:
+    counts, canonical = file_term_counts(path, size)
+    if not counts:
         return 0
-    total = 0
-    seen = 0
-    for p in folder.rglob("*"):
-        if seen >= MAX_FILES_PER_DIR_SCAN:
-            break
-        if any(part in SKIP_DIRS for part in p.parts):
+    return merge_counts(lib, counts, canonical, channel)
+
+
+def _process_file(path: str, size: int) -> tuple[Counter[str], dict[str, str]]:
+    # Module-level so ProcessPoolExecutor can pickle it.
+    return file_term_counts(Path(path), size)
+
+
+def combine_counts(
+    counts: Counter[str],
+    canonical: dict[str, str],
+    more_counts: Counter[str],
+    more_canonical: dict[str, str],
+) -> None:
+    counts.update(more_counts)
+    for k, tok in more_canonical.items():
+        best = canonical.get(k)
+        if best is None or signal_score(tok) > signal_score(best):
+            canonical[k] = tok
+
+
+def scan_text_dir(folder: Path) -> list[tuple[str, int]]:
+    files: list[tuple[str, int]] = []
+    # Depth-first scandir walk: skipped dirs are pruned before descent, and the
+    # DirEntry stat is handed on so files are not re-stat'ed.
+    stack = [str(folder)]
+    while stack and len(files) < MAX_FILES_PER_DIR_SCAN:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
             continue
-        if p.is_file():
-            seen += 1
-            total += ingest_file(lib, p, channel)
-    return total
+        with it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in SKIP_DIRS:
+                            stack.append(entry.path)
+                        continue
+                    if not entry.is_file():
+                        continue
+                    files.append((entry.path, entry.stat().st_size))
+                except OSError:
+                    continue
+                if len(files) >= MAX_FILES_PER_DIR_SCAN:
+                    break
+    return files
+
+
+def ingest_text_dir(lib: TermTable, folder: Path, channel: str) -> int:
+    if not folder.exists() or any(part in SKIP_DIRS for part in folder.parts):
+        return 0
+    files = scan_text_dir(folder)
+    counts: Counter[str] = Counter()
+    canonical: dict[str, str] = {}
+    if len(files) < PARALLEL_MIN_FILES or (os.cpu_count() or 1) < 2:
+        for path, size in files:
+            combine_counts(counts, canonical, *_process_file(path, size))
+    else:
+        # Extraction is per-file and independent; fuzzy merging stays in the parent
+        # and runs once over the deduplicated union.
+        paths, sizes = zip(*files)
+        with ProcessPoolExecutor() as ex:
+            for file_counts, file_canonical in ex.map(_process_file, paths, sizes, chunksize=16):
+                combine_counts(counts, canonical, file_counts, file_canonical)
+    if not counts:
+        return 0
+    return merge_counts(lib, counts, canonical, channel)
+
 
+def quote_ident(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
 
-def ingest_sqlite(lib: dict[str, TermStats], db_path: Path, channel: str) -> int:
+
+def iter_cursor_terms(cur: sqlite3.Cursor) -> Iterator[str]:
+    while rows := cur.fetchmany():
+        for (val,) in rows:
+            if isinstance(val, str) and len(val) >= 3:
+                yield from extract_terms(val)
+
+
+def ingest_sqlite(lib: TermTable, db_path: Path, channel: str) -> int:
     if not db_path.exists() or not db_path.is_file():
         return 0
     total = 0
     try:
-        conn = sqlite3.connect(str(db_path))
-        cur = conn.cursor()
-        tables = [r[0] for r in cur.execute("SELECT name FROM sqlite_master WHERE type='table'")]
-        for table in tables:
-            cols = cur.execute(f"PRAGMA table_info('{table}')").fetchall()
-            text_cols = [c[1] for c in cols if str(c[2]).upper() in {"TEXT", "VARCHAR", "CHAR", "CLOB"}]
-            if not text_cols:
-                continue
-            for col in text_cols:
-                try:
-                    q = f"SELECT {col} FROM '{table}' WHERE {col} IS NOT NULL LIMIT 20000"
-                    for (val,) in cur.execute(q):
-                        if not isinstance(val, str) or len(val) < 3:
-                            continue
-                        total += add_terms(lib, extract_terms(val), channel)
-                except Exception:
+        with contextlib.closing(sqlite3.connect(str(db_path))) as conn:
+            conn.execute("PRAGMA mmap_size=268435456")
+            conn.execute("PRAGMA cache_size=-65536")
+            cur = conn.cursor()
+            cur.arraysize = 1000
+            tables = [r[0] for r in cur.execute("SELECT name FROM sqlite_master WHERE type='table'")]
+            for table in tables:
+                cols = cur.execute(f"PRAGMA table_info({quote_ident(table)})").fetchall()
+                text_cols = [c[1] for c in cols if str(c[2]).upper() in {"TEXT", "VARCHAR", "CHAR", "CLOB"}]
+                if not text_cols:
                     continue
-        conn.close()
+                # One library merge per table instead of one per row.
+                counts: Counter[str] = Counter()
+                canonical: dict[str, str] = {}
+                for col in text_cols:
+                    try:
+                        c = quote_ident(col)
+                        cur.execute(f"SELECT {c} FROM {quote_ident(table)} WHERE {c} IS NOT NULL LIMIT 20000")
+                        combine_counts(counts, canonical, *aggregate_terms(iter_cursor_terms(cur)))
+                    except Exception:
+                        continue
+                if counts:
+                    total += merge_counts(lib, counts, canonical, channel)
     except Exception:
         return total
     return total
 
 
-def build_vocab(lib: dict[str, TermStats], max_terms: int, min_count: int) -> dict[str, Any]:
+def write_lines(path: Path, lines: Iterable[str]) -> None:
+    # Encode line by line into a large buffer instead of joining one big string first.
+    with path.open("wb", buffering=1 << 20) as f:
+        for line in lines:
+            f.write(line.encode("utf-8"))
+            f.write(b"\n")
+
+
+def build_vocab(lib: TermTable, max_terms: int, min_count: int) -> dict[str, Any]:
     manual_terms = []
     if manual_path().exists():
         manual_terms = [
@@ -417,21 +823,22 @@ def build_vocab(lib: dict[str, TermStats], max_terms: int, min_count: int) -> di
             if normalize_token(x) and not normalize_token(x).startswith("#")
         ]
 
-    scored: list[tuple[float, TermStats]] = []
-    for stats in lib.values():
-        if stats.count < min_count:
+    counts, last_seen = lib.counts, lib.last_seen
+    scored: list[tuple[float, int]] = []
+    for i, term in enumerate(lib.terms):
+        if counts[i] < min_count:
             continue
-        if not looks_vocab_candidate(stats.term):
+        if not looks_vocab_candidate(term):
             continue
-        score = hard_term_score(stats)
+        score = hard_term_score(lib.row(i))
         if score < 2.6:
             continue
-        scored.append((score, stats))
+        scored.append((score, i))
 
-    scored.sort(key=lambda pair: (pair[0], pair[1].count, pair[1].last_seen), reverse=True)
-    auto_terms = [s.term for _, s in scored][:max_terms]
+    top = heapq.nlargest(max_terms, scored, key=lambda pair: (pair[0], counts[pair[1]], last_seen[pair[1]]))
+    auto_terms = [lib.terms[i] for _, i in top]
 
-    auto_vocab_path().write_text("\n".join(auto_terms) + ("\n" if auto_terms else ""), encoding="utf-8")
+    write_lines(auto_vocab_path(), auto_terms)
 
     merged = []
     seen = set()
@@ -441,7 +848,7 @@ def build_vocab(lib: dict[str, TermStats], max_terms: int, min_count: int) -> di
             seen.add(k)
             merged.append(t)
 
-    merged_vocab_path().write_text("\n".join(merged) + ("\n" if merged else ""), encoding="utf-8")
+    write_lines(merged_vocab_path(), merged)
     return {
         "manual_terms": len(manual_terms),
         "auto_terms": len(auto_terms),
@@ -453,7 +860,7 @@ def build_vocab(lib: dict[str, TermStats], max_terms: int, min_count: int) -> di
     }
 
 
-def ingest_auto(lib: dict[str, TermStats], cfg_path: Path) -> dict[str, int]:
+def ingest_auto(lib: TermTable, cfg_path: Path) -> dict[str, int]:
     cfg = json.loads(cfg_path.read_text(encoding="utf-8"))
     added_by_channel: dict[str, int] = {}
     for ch in cfg.get("channels", []):
@@ -469,30 +876,31 @@ def ingest_auto(lib: dict[str, TermStats], cfg_path: Path) -> dict[str, int]:
     return added_by_channel
 
 
-def cmd_stats(lib: dict[str, TermStats], top: int) -> dict[str, Any]:
-    ranked = sorted(lib.values(), key=lambda x: (x.count, x.last_seen), reverse=True)
+def cmd_stats(lib: TermTable, top: int) -> dict[str, Any]:
+    ranked = heapq.nlargest(top, range(len(lib)), key=lambda i: (lib.counts[i], lib.last_seen[i]))
     return {
         "terms_total": len(lib),
         "top": [
-            {"term": t.term, "count": t.count, "channels": t.channels}
-            for t in ranked[:top]
+            {"term": lib.terms[i], "count": lib.counts[i], "channels": dict(lib.channels[i])}
+            for i in ranked
         ],
     }
 
 
 def main() -> int:
     args = parse_args()
-    lib = load_library()
+    db = LibraryDB(db_path())
+    lib = db.load()
 
     if args.cmd == "ingest-text":
         added = add_terms(lib, extract_terms(args.text), args.channel)
-        save_library(lib)
+        db.save(lib)
         print(json.dumps({"event": "terms_ingest_text", "added": added, "total_terms": len(lib)}, ensure_ascii=False))
         return 0
 
     if args.cmd == "ingest-file":
         added = ingest_file(lib, Path(args.path), args.channel)
-        save_library(lib)
+        db.save(lib)
         print(json.dumps({"event": "terms_ingest_file", "added": added, "total_terms": len(lib)}, ensure_ascii=False))
         return 0
 
@@ -503,13 +911,13 @@ def main() -> int:
         except Exception:
             payload = ""
         added = add_terms(lib, extract_terms(payload), args.channel)
-        save_library(lib)
+        db.save(lib)
         print(json.dumps({"event": "terms_ingest_stdin", "added": added, "total_terms": len(lib)}, ensure_ascii=False))
         return 0
 
     if args.cmd == "ingest-auto":
         added_map = ingest_auto(lib, Path(args.config))
-        save_library(lib)
+        db.save(lib)
         print(json.dumps({"event": "terms_ingest_auto", "added_by_channel": added_map, "total_terms": len(lib)}, ensure_ascii=False))
         return 0
 
@@ -520,11 +928,16 @@ def main() -> int:
 
     if args.cmd == "rebuild":
         added_map = ingest_auto(lib, terms_dir() / "sources.json")
-        save_library(lib)
+        db.save(lib)
         built = build_vocab(lib, 300, 2)
         print(json.dumps({"event": "terms_rebuild", "added_by_channel": added_map, **built, "total_terms": len(lib)}, ensure_ascii=False))
         return 0
 
+    if args.cmd == "export-json":
+        export_library_json(lib, Path(args.path))
+        print(json.dumps({"event": "terms_export_json", "path": args.path, "total_terms": len(lib)}, ensure_ascii=False))
+        return 0
+
     if args.cmd == "stats":
         print(json.dumps(cmd_stats(lib, args.top), ensure_ascii=False))
         return 0
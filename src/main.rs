@@ -1,4 +1,4 @@
-use std::io::{BufRead, BufReader as StdBufReader, Write};
+use std::io::{Read, Write};
 use std::os::unix::net::UnixStream;
 use std::os::unix::process::CommandExt;
 use std::path::{Path, PathBuf};
@@ -11,6 +11,9 @@ use clap::{Parser, Subcommand, ValueEnum};
 use tokio::io::{AsyncBufReadExt, BufReader};
 use tokio::process::Command;
 
+/// Daemon wire format: version byte + big-endian u32 length + JSON body (both directions).
+const DAEMON_FRAME_V1: u8 = 0x01;
+
 #[derive(Debug, Parser)]
 #[command(name = "parakeet")]
 #[command(about = "Fast local transcription CLI using NVIDIA Parakeet")]
@@ -27,6 +30,12 @@ struct TranscribeCli {
     #[arg(long, default_value = "auto")]
     device: String,
 
+    #[arg(long, value_enum, default_value_t = Backend::Nano)]
+    backend: Backend,
+
+    #[arg(long, value_enum, default_value_t = Precision::Auto)]
+    precision: Precision,
+
     #[arg(long)]
     vocab: Option<PathBuf>,
 
@@ -116,6 +125,20 @@ enum OutputFormat {
     Md,
 }
 
+#[derive(Copy, Clone, Debug, ValueEnum)]
+enum Backend {
+    Nano,
+    Nemo,
+}
+
+#[derive(Copy, Clone, Debug, ValueEnum)]
+enum Precision {
+    Auto,
+    Fp32,
+    Bf16,
+    Fp16,
+}
+
 #[derive(Copy, Clone, Debug, ValueEnum)]
 enum EmitMode {
     Text,
@@ -128,6 +151,8 @@ struct BackendRequest<'a> {
     output: Option<&'a Path>,
     model: &'a str,
     device: &'a str,
+    backend: &'a str,
+    precision: &'a str,
     vocab: Option<&'a Path>,
     format: &'a str,
     timestamps: bool,
@@ -414,6 +439,16 @@ async fn run_transcribe(cli: TranscribeCli) -> Result<()> {
         OutputFormat::Text => "text",
         OutputFormat::Md => "md",
     };
+    let backend_name = match cli.backend {
+        Backend::Nano => "nano",
+        Backend::Nemo => "nemo",
+    };
+    let precision = match cli.precision {
+        Precision::Auto => "auto",
+        Precision::Fp32 => "fp32",
+        Precision::Bf16 => "bf16",
+        Precision::Fp16 => "fp16",
+    };
     let model_name = cli
         .model
         .as_deref()
@@ -427,6 +462,8 @@ async fn run_transcribe(cli: TranscribeCli) -> Result<()> {
         output: cli.out.as_deref(),
         model: model_name,
         device: &cli.device,
+        backend: backend_name,
+        precision,
         vocab: merged_vocab_path.as_deref(),
         format: output_format,
         timestamps: cli.timestamps,
@@ -546,17 +583,28 @@ fn try_daemon_request(socket_path: &Path, request_json: &str) -> Result<BackendR
         .with_context(|| format!("daemon socket not reachable: {}", socket_path.display()))?;
     stream.set_read_timeout(Some(Duration::from_secs(180)))?;
     stream.set_write_timeout(Some(Duration::from_secs(30)))?;
-    stream.write_all(request_json.as_bytes())?;
-    stream.write_all(b"\n")?;
 
-    let mut reader = StdBufReader::new(stream);
-    let mut line = String::new();
-    reader.read_line(&mut line)?;
-    if line.trim().is_empty() {
+    let body = request_json.as_bytes();
+    let len = u32::try_from(body.len()).context("daemon request too large")?;
+    let mut frame = Vec::with_capacity(5 + body.len());
+    frame.push(DAEMON_FRAME_V1);
+    frame.extend_from_slice(&len.to_be_bytes());
+    frame.extend_from_slice(body);
+    stream.write_all(&frame)?;
+
+    let mut header = [0u8; 5];
+    stream.read_exact(&mut header)?;
+    if header[0] != DAEMON_FRAME_V1 {
+        bail!("unsupported daemon frame version: {}", header[0]);
+    }
+    let len = u32::from_be_bytes([header[1], header[2], header[3], header[4]]) as usize;
+    let mut payload = vec![0u8; len];
+    stream.read_exact(&mut payload)?;
+    if payload.is_empty() {
         bail!("empty daemon response");
     }
     let parsed: BackendResponse =
-        serde_json::from_str(line.trim()).context("invalid daemon JSON response")?;
+        serde_json::from_slice(&payload).context("invalid daemon JSON response")?;
     Ok(parsed)
 }
 
@@ -630,7 +678,11 @@ fn prepare_vocab_file(
         out.push_str(&term);
         out.push('\n');
     }
-    fs::write(&merged_path, out)
-        .with_context(|| format!("failed writing merged vocab: {}", merged_path.display()))?;
+    // Leave the file (and its mtime) untouched when unchanged so the daemon's
+    // vocab cache keyed by (path, mtime) keeps hitting.
+    if fs::read_to_string(&merged_path).ok().as_deref() != Some(out.as_str()) {
+        fs::write(&merged_path, out)
+            .with_context(|| format!("failed writing merged vocab: {}", merged_path.display()))?;
+    }
     Ok(Some(merged_path))
 }